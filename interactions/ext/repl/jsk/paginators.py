@@ -1,11 +1,10 @@
 import asyncio
 import collections
 import traceback
+from contextlib import suppress
 from typing import Optional
 
-from interactions.ext.wait_for import wait_for
-
-from interactions import Client, Message
+from interactions import Client, Emoji, Message, MessageReaction
 
 EmojiSettings = collections.namedtuple("EmojiSettings", "start back forward end close")
 
@@ -45,29 +44,30 @@ class Paginator:
         self.suffix = suffix
         self.max_size = max_size
         self.linesep = linesep
+        # bumped on every mutation so rendered views can tell when they are stale
+        self._pages_version = 0
         self.clear()
 
     def clear(self):
         """Clears the paginator to have no pages."""
+        # lengths are cached here rather than recomputed per line
+        self._prefix_len = len(self.prefix) if self.prefix else 0
+        self._suffix_len = len(self.suffix) if self.suffix else 0
+        self._linesep_len = len(self.linesep)
+        self._max_page_size = (
+            self.max_size - self._prefix_len - self._suffix_len - 2 * self._linesep_len
+        )
+        self._page_size_excl_suffix = self.max_size - self._suffix_len
+
         if self.prefix is not None:
-            self._current_page = [self.prefix]
+            self._current_page = collections.deque((self.prefix,))
             self._count = len(self.prefix) + self._linesep_len  # prefix + newline
         else:
-            self._current_page = []
+            self._current_page = collections.deque()
             self._count = 0
         self._pages = []
-
-    @property
-    def _prefix_len(self):
-        return len(self.prefix) if self.prefix else 0
-
-    @property
-    def _suffix_len(self):
-        return len(self.suffix) if self.suffix else 0
-
-    @property
-    def _linesep_len(self):
-        return len(self.linesep)
+        self._pages_total_len = 0
+        self._pages_version += 1
 
     def add_line(self, line="", *, empty=False):
         """Adds a line to the current page.
@@ -87,41 +87,47 @@ class Paginator:
         RuntimeError
             The line was too big for the current :attr:`max_size`.
         """
-        max_page_size = (
-            self.max_size - self._prefix_len - self._suffix_len - 2 * self._linesep_len
-        )
-        if len(line) > max_page_size:
-            raise RuntimeError("Line exceeds maximum page size %s" % (max_page_size))
+        if len(line) > self._max_page_size:
+            raise RuntimeError(
+                "Line exceeds maximum page size %s" % (self._max_page_size)
+            )
 
-        if (
-            self._count + len(line) + self._linesep_len
-            > self.max_size - self._suffix_len
-        ):
+        line_len = len(line) + self._linesep_len
+        if self._count + line_len > self._page_size_excl_suffix:
             self.close_page()
 
-        self._count += len(line) + self._linesep_len
+        self._count += line_len
         self._current_page.append(line)
 
         if empty:
             self._current_page.append("")
             self._count += self._linesep_len
 
+        self._pages_version += 1
+
     def close_page(self):
         """Prematurely terminate a page."""
+        page = self.linesep.join(self._current_page)
         if self.suffix is not None:
-            self._current_page.append(self.suffix)
-        self._pages.append(self.linesep.join(self._current_page))
-
+            # append the suffix to the joined page rather than joining it in
+            if self._current_page:
+                page += self.linesep + self.suffix
+            else:
+                page = self.suffix
+        self._pages.append(page)
+        self._pages_total_len += len(page)
+        self._pages_version += 1
+
+        # reuse the current page buffer instead of allocating a new one
+        self._current_page.clear()
         if self.prefix is not None:
-            self._current_page = [self.prefix]
+            self._current_page.append(self.prefix)
             self._count = len(self.prefix) + self._linesep_len  # prefix + linesep
         else:
-            self._current_page = []
             self._count = 0
 
     def __len__(self):
-        total = sum(len(p) for p in self._pages)
-        return total + self._count
+        return self._pages_total_len + self._count
 
     @property
     def pages(self):
@@ -166,39 +172,47 @@ class WrappedPaginator(Paginator):
         self.include_wrapped = include_wrapped
         self.force_wrap = force_wrap
 
+    def clear(self):
+        """Clears the paginator to have no pages."""
+        super().clear()
+        self._true_max_size = self._max_page_size + 2 * self._linesep_len - 2
+
     def add_line(self, line="", *, empty=False):
-        true_max_size = self.max_size - self._prefix_len - self._suffix_len - 2
+        true_max_size = self._true_max_size
         original_length = len(line)
+        start = 0
 
-        while len(line) > true_max_size:
-            search_string = line[: true_max_size - 1]
+        # walk an offset through the line instead of re-slicing the remainder each pass
+        while original_length - start > true_max_size:
+            search_end = start + true_max_size - 1
             wrapped = False
 
             for delimiter in self.wrap_on:
-                position = search_string.rfind(delimiter)
+                position = line.rfind(delimiter, start, search_end)
 
-                if position > 0:
-                    super().add_line(line[:position], empty=empty)
+                if position - start > 0:
+                    super().add_line(line[start:position], empty=empty)
                     wrapped = True
 
                     if self.include_wrapped:
-                        line = line[position:]
+                        start = position
                     else:
-                        line = line[position + len(delimiter) :]
+                        start = position + len(delimiter)
 
                     break
 
             if not wrapped:
                 if not self.force_wrap:
                     raise ValueError(
-                        f"Line of length {original_length} had sequence of {len(line)} characters"
+                        f"Line of length {original_length} had sequence of"
+                        f" {original_length - start} characters"
                         f" (max is {true_max_size}) that WrappedPaginator could not wrap with"
                         f" delimiters: {self.wrap_on}"
                     )
 
-                super().add_line(line[: true_max_size - 1])
-                line = line[true_max_size - 1 :]
-        super().add_line(line, empty=empty)
+                super().add_line(line[start:search_end])
+                start = search_end
+        super().add_line(line[start:], empty=empty)
 
 
 class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
@@ -247,11 +261,19 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
 
         self.sent_page_reactions = False
 
+        self._active_emojis = tuple(e for e in self.emojis if e)
+        self._emoji_set = frozenset(self._active_emojis)
+        self._bot_user_id = None
+        self._event_queue: asyncio.Queue = asyncio.Queue()
+
         self.task: asyncio.Task = None
         self.send_lock: asyncio.Event = asyncio.Event()
 
         self.close_exception: Exception = None
 
+        self._pages_cache = (None, None)
+        self._send_kwargs_cache = (None, None, None)
+
         if self.page_size > self.max_page_size:
             raise ValueError(
                 f"Paginator passed has too large of a page size for this interface. "
@@ -263,9 +285,22 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
         """
         Returns the paginator's pages without prematurely closing the active page.
         """
+
+        return list(self._rendered_pages())
+
+    def _rendered_pages(self) -> tuple:
+        """
+        Returns the rendered pages, cached until the paginator next changes.
+        A tuple is cached so callers cannot mutate the shared value.
+        """
         # protected access has to be permitted here to not close the paginator's pages
 
         # pylint: disable=protected-access
+        version = self.paginator._pages_version
+        cached_version, cached_pages = self._pages_cache
+        if cached_version == version:
+            return cached_pages
+
         paginator_pages = list(self.paginator._pages)
         if len(self.paginator._current_page) > 1:
             paginator_pages.append(
@@ -275,6 +310,8 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
             )
         # pylint: enable=protected-access
 
+        paginator_pages = tuple(paginator_pages)
+        self._pages_cache = (version, paginator_pages)
         return paginator_pages
 
     @property
@@ -283,7 +320,7 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
         Returns the page count of the internal paginator.
         """
 
-        return len(self.pages)
+        return len(self._rendered_pages())
 
     @property
     def display_page(self):
@@ -322,9 +359,18 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
         """
 
         display_page = self.display_page
+        version = self.paginator._pages_version  # pylint: disable=protected-access
+
+        cached_page, cached_version, cached_kwargs = self._send_kwargs_cache
+        if cached_page == display_page and cached_version == version:
+            return cached_kwargs
+
         page_num = f"\nPage {display_page + 1}/{self.page_count}"
-        content = self.pages[display_page] + page_num
-        return {"content": content}
+        content = self._rendered_pages()[display_page] + page_num
+        send_kwargs = {"content": content}
+
+        self._send_kwargs_cache = (display_page, version, send_kwargs)
+        return send_kwargs
 
     async def add_line(self, *args, **kwargs):
         """
@@ -353,6 +399,7 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
         """
 
         self.message = await destination.send(**self.send_kwargs)
+        self._bot_user_id = self.bot.me.user.id
 
         # add the close reaction
         await self.message.add_reaction(self.emojis.close)
@@ -376,7 +423,7 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
         This method is generally for internal use only.
         """
 
-        for emoji in filter(None, self.emojis):
+        for emoji in self._active_emojis:
             try:
                 await self.message.add_reaction(emoji)
             except discord.NotFound:
@@ -403,44 +450,84 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
         await asyncio.sleep(1)
         return gathered
 
-    async def wait_loop(self):  # pylint: disable=too-many-branches, too-many-statements
+    _reaction_events = ("on_reaction_add", "on_reaction_remove")
+
+    @staticmethod
+    def _reaction_emoji(payload: MessageReaction):
         """
-        Waits on a loop for reactions to the message. This should not be called manually - it is handled by `send_to`.
+        Returns the emoji of a reaction, as its name if it is a unicode emoji.
         """
 
-        start, back, forward, end, close = self.emojis
+        emoji = payload.emoji
+        # unicode emojis have no id, and are matched against `emojis` by name
+        if isinstance(emoji, Emoji) and emoji.id is None:
+            emoji = emoji.name
+        return emoji
 
-        def check(payload: discord.RawReactionActionEvent):
-            """
-            Checks if this reaction is related to the paginator interface.
-            """
+    def _check_reaction(self, payload: MessageReaction) -> bool:
+        """
+        Checks if this reaction is related to the paginator interface.
+        """
 
-            owner_check = not self.owner or payload.user_id == self.owner.id
+        if self.owner and payload.user_id != self.owner.id:
+            return False
 
-            emoji = payload.emoji
-            if isinstance(emoji, discord.PartialEmoji) and emoji.is_unicode_emoji():
-                emoji = emoji.name
+        if payload.message_id != self.message.id:
+            return False
 
-            tests = (
-                owner_check,
-                payload.message_id == self.message.id,
-                emoji,
-                emoji in self.emojis,
-                payload.user_id != self.bot.me.user.id,
-            )
+        emoji = self._reaction_emoji(payload)
+        return (
+            bool(emoji)
+            and emoji in self._emoji_set
+            and payload.user_id != self._bot_user_id
+        )
+
+    async def _queue_reaction(self, payload: MessageReaction):
+        """
+        A persistent reaction listener that feeds relevant reactions to `wait_loop`.
+        """
+
+        if self._check_reaction(payload):
+            self._event_queue.put_nowait(payload)
+
+    def _add_reaction_listeners(self):
+        """
+        Registers `_queue_reaction` for every event in `_reaction_events`.
+        """
+
+        for event_name in self._reaction_events:
+            self.bot.event(self._queue_reaction, name=event_name)
+
+    def _remove_reaction_listeners(self):
+        """
+        Unregisters the listeners added by `_add_reaction_listeners`.
+
+        The client has no public way to remove a listener, so this edits the
+        dispatcher's event lists directly. That is the same `Listener.events` dict
+        (event name to list of coroutines) that `Client.event` registers into and
+        `interactions.ext.wait_for` uses.
+        """
+
+        # pylint: disable=protected-access
+        events = self.bot._websocket._dispatch.events
+        for event_name in self._reaction_events:
+            with suppress(KeyError, ValueError):
+                events[event_name].remove(self._queue_reaction)
 
-            return all(tests)
+    async def wait_loop(self):  # pylint: disable=too-many-branches, too-many-statements
+        """
+        Waits on a loop for reactions to the message. This should not be called manually - it is handled by `send_to`.
+        """
 
+        start, back, forward, end, close = self.emojis
+        # fixed slots: [reaction queue, send lock], replaced in place as they complete
         task_list = [
-            self.bot._loop.create_task(coro)
-            for coro in {
-                wait_for(self.bot, "on_reaction_add", check=check),
-                wait_for(self.bot, "on_reaction_remove", check=check),
-                self.send_lock_delayed(),
-            }
+            self.bot._loop.create_task(self._event_queue.get()),
+            self.bot._loop.create_task(self.send_lock_delayed()),
         ]
 
         try:  # pylint: disable=too-many-nested-blocks
+            self._add_reaction_listeners()
             last_kwargs = None
 
             while not self.bot._loop.is_closed():
@@ -451,62 +538,48 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
                 if not done:
                     raise asyncio.TimeoutError
 
-                for task in done:
-                    task_list.remove(task)
-                    payload = task.result()
-
-                    if isinstance(payload, discord.RawReactionActionEvent):
-                        emoji = payload.emoji
-                        if (
-                            isinstance(emoji, discord.PartialEmoji)
-                            and emoji.is_unicode_emoji()
-                        ):
-                            emoji = emoji.name
-
-                        if emoji == close:
-                            await self.message.delete()
-                            return
-
-                        if emoji == start:
-                            self._display_page = 0
-                        elif emoji == end:
-                            self._display_page = self.page_count - 1
-                        elif emoji == back:
-                            self._display_page -= 1
-                        elif emoji == forward:
-                            self._display_page += 1
-
-                        if payload.event_type == "REACTION_ADD":
-                            task_list.append(
-                                self.bot._loop.create_task(
-                                    self.bot.wait_for("raw_reaction_add", check=check)
-                                )
-                            )
-                        elif payload.event_type == "REACTION_REMOVE":
-                            task_list.append(
-                                self.bot._loop.create_task(
-                                    self.bot.wait_for(
-                                        "raw_reaction_remove", check=check
-                                    )
-                                )
-                            )
-                    else:
-                        # Send lock was released
-                        task_list.append(
-                            self.bot._loop.create_task(self.send_lock_delayed())
-                        )
+                page_count = self.page_count
 
-                if not self.sent_page_reactions and self.page_count > 1:
+                event_task, lock_task = task_list
+
+                if event_task.done():
+                    payload = event_task.result()
+
+                    emoji = self._reaction_emoji(payload)
+
+                    if emoji == close:
+                        await self.message.delete()
+                        return
+
+                    if emoji == start:
+                        self._display_page = 0
+                    elif emoji == end:
+                        self._display_page = page_count - 1
+                    elif emoji == back:
+                        self._display_page -= 1
+                    elif emoji == forward:
+                        self._display_page += 1
+
+                    task_list[0] = self.bot._loop.create_task(self._event_queue.get())
+
+                if lock_task.done():
+                    # Send lock was released
+                    task_list[1] = self.bot._loop.create_task(self.send_lock_delayed())
+
+                if not self.sent_page_reactions and page_count > 1:
                     self.bot._loop.create_task(self.send_all_reactions())
                     self.sent_page_reactions = True  # don't spawn any more tasks
 
-                if self.send_kwargs != last_kwargs:
+                send_kwargs = self.send_kwargs
+                # compare by value: the cache is keyed on the paginator version, so
+                # output landing on another page yields an equal but new dict
+                if send_kwargs != last_kwargs:
                     try:
-                        await self.message.edit(**self.send_kwargs)
+                        await self.message.edit(**send_kwargs)
                     except Exception:
                         traceback.format_exc()
 
-                    last_kwargs = self.send_kwargs
+                    last_kwargs = send_kwargs
 
         except (asyncio.CancelledError, asyncio.TimeoutError) as exception:
             self.close_exception = exception
@@ -518,7 +591,7 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
                 if self.delete_message:
                     return await self.message.delete()
 
-                for emoji in filter(None, self.emojis):
+                for emoji in self._active_emojis:
                     try:
                         self.bot._http.remove_self_reaction(
                             int(self.message.channel_id), int(self.message.id), emoji
@@ -529,5 +602,7 @@ class PaginatorInterface:  # pylint: disable=too-many-instance-attributes
                 pass
 
         finally:
+            self._remove_reaction_listeners()
+
             for task in task_list:
                 task.cancel()
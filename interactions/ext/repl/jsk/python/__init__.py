@@ -1,3 +1,4 @@
-from .compilation import AsyncCodeExecutor, jsk_python_result_handling
+from .compilation import (AsyncCodeExecutor, apply_replacements,
+                          jsk_python_result_handling)
 from .jsk_functools import AsyncSender
 from .scope import Scope
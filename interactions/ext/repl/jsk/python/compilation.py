@@ -13,10 +13,13 @@ Constants, functions and classes related to classifying, compiling and executing
 
 import ast
 import asyncio
+import copy
 import functools
 import inspect
 import io
 import linecache
+import re
+import types
 
 import import_expression
 
@@ -48,6 +51,35 @@ async def _repl_coroutine({{0}}):
     import_expression.constants.IMPORTER
 )
 
+# parsed CORO_CODE modules, keyed by the argument string they were formatted with
+_CORO_TEMPLATES = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _replacement_pattern(words: tuple) -> re.Pattern:
+    """
+    Compiles a single alternation pattern matching any of the given words.
+    Longer words are tried first so they win over any prefix of themselves.
+    """
+
+    return re.compile(
+        "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    )
+
+
+def apply_replacements(text: str, replacements: dict) -> str:
+    """
+    Replaces every occurrence of each key in `replacements` with its value,
+    in one pass over `text`.
+    """
+
+    replacements = {before: after for before, after in replacements.items() if before}
+    if not replacements:
+        return text
+
+    pattern = _replacement_pattern(tuple(replacements))
+    return pattern.sub(lambda match: replacements[match.group(0)], text)
+
 
 def wrap_code(code: str, args: str = "") -> ast.Module:
     """
@@ -57,7 +89,12 @@ def wrap_code(code: str, args: str = "") -> ast.Module:
     """
 
     user_code = import_expression.parse(code, mode="exec")
-    mod = import_expression.parse(CORO_CODE.format(args), mode="exec")
+    template = _CORO_TEMPLATES.get(args)
+    if template is None:
+        template = import_expression.parse(CORO_CODE.format(args), mode="exec")
+        _CORO_TEMPLATES[args] = template
+
+    mod = copy.deepcopy(template)
 
     definition = mod.body[-1]  # async def ...:
     assert isinstance(definition, ast.AsyncFunctionDef)
@@ -65,10 +102,10 @@ def wrap_code(code: str, args: str = "") -> ast.Module:
     try_block = definition.body[-1]  # try:
     assert isinstance(try_block, ast.Try)
 
+    # both the template and the user code come out of the parser with locations,
+    # and the only nodes added below copy theirs, so no full-tree fixup is needed
     try_block.body.extend(user_code.body)
 
-    ast.fix_missing_locations(mod)
-
     KeywordTransformer().generic_visit(try_block)
 
     last_expr = try_block.body[-1]
@@ -92,6 +129,16 @@ def wrap_code(code: str, args: str = "") -> ast.Module:
     return mod
 
 
+@functools.lru_cache(maxsize=128)
+def compile_code(code: str, args: str = "") -> types.CodeType:
+    """
+    Wraps and compiles Python code,
+    reusing the code object for repeated source and arguments.
+    """
+
+    return compile(wrap_code(code, args=args), "<python>", "exec")
+
+
 class AsyncCodeExecutor:  # pylint: disable=too-few-public-methods
     """
     Executes/evaluates Python code inside of an async function or generator.
@@ -112,7 +159,7 @@ class AsyncCodeExecutor:  # pylint: disable=too-few-public-methods
         print(total)
     """
 
-    __slots__ = ("args", "arg_names", "code", "loop", "scope", "source")
+    __slots__ = ("args", "arg_names", "loop", "scope", "source", "_code", "_code_obj")
 
     def __init__(
         self,
@@ -130,13 +177,25 @@ class AsyncCodeExecutor:  # pylint: disable=too-few-public-methods
                 self.args.append(value)
 
         self.source = code
-        self.code = wrap_code(code, args=", ".join(self.arg_names))
+        self._code = None
+        self._code_obj = compile_code(code, args=", ".join(self.arg_names))
         self.scope = scope or Scope()
         self.loop = loop or asyncio.get_event_loop()
 
+    @property
+    def code(self) -> ast.Module:
+        """
+        The wrapped AST of the source.
+        This is only built when first accessed, execution uses the cached code object.
+        """
+
+        if self._code is None:
+            self._code = wrap_code(self.source, args=", ".join(self.arg_names))
+        return self._code
+
     def __aiter__(self):
         exec(
-            compile(self.code, "<python>", "exec"),
+            self._code_obj,
             self.scope.globals,
             self.scope.locals,
         )  # pylint: disable=exec-used
@@ -181,9 +240,7 @@ async def jsk_python_result_handling(
     What you return is what gets stored in the temporary _ variable.
     """
     channel = await msg.get_channel()
-    send = functools.partial(
-        channel.send,
-    )
+    send = channel.send
 
     if isinstance(result, Message):
         return await send(f"<Message <{result.id}>>")
@@ -201,19 +258,20 @@ async def jsk_python_result_handling(
         # repr all non-strings
         result = repr(result)
 
-    for before, after in blacklist.items():
-        # .replace doesn't seem to work?
-        temp = result.split(before)
-        result = after.join(temp)
+    replacements = blacklist
+    token = msg._client.token
+    # the token is rarely present, so only add it to the pass when it actually is
+    if token and token in result:
+        replacements = {**blacklist, token: "[token omitted]"}
+
+    result = apply_replacements(result, replacements)
 
     # Eventually the below handling should probably be put somewhere else
     if len(result) <= 1900:
         if result.strip() == "":
             result = "\u200b"
 
-        return await send(
-            "```py\n" + result.replace(msg._client.token, "[token omitted]") + "\n```"
-        )
+        return await send("```py\n" + result + "\n```")
 
     # inconsistency here, results get wrapped in codeblocks when they are too large
     #  but don't if they're not. probably not that bad, but noting for later review
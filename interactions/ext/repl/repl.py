@@ -10,8 +10,8 @@ from interactions.ext.wait_for import wait_for
 
 from interactions import Client, Extension, Message, extension_listener
 
-from .jsk import (AsyncCodeExecutor, Scope, codeblock_converter,
-                  jsk_python_result_handling)
+from .jsk import (AsyncCodeExecutor, Scope, apply_replacements,
+                  codeblock_converter, jsk_python_result_handling)
 
 
 class ReplExtension(Extension):
@@ -77,16 +77,18 @@ class ReplExtension(Extension):
         send = partial(env["channel"].send)
         author = env["author"]
 
+        channel_id = int(msg.channel_id)
+        author_id = int(author.id)
+
         def check(_message: Message) -> bool:
-            _message_author = _message.member or _message.author
-            is_codeblock = _message.content.startswith(
-                "`"
-            ) and _message.content.endswith("`")
+            content = _message.content
+            if content[:1] != "`" or content[-1:] != "`":
+                return False
 
+            _message_author = _message.member or _message.author
             return (
-                int(msg.channel_id) == int(_message.channel_id)
-                and int(author.id) == int(_message_author.id)
-                and is_codeblock
+                int(_message.channel_id) == channel_id
+                and int(_message_author.id) == author_id
             )
 
         await msg.reply("Starting repl")
@@ -106,7 +108,12 @@ class ReplExtension(Extension):
             if code.content in ("quit", "exit", "exit()"):
                 return await msg.reply("Exiting.")
 
+            # a fresh buffer per command, so anything that captured sys.stdout during an
+            # earlier command can't leak its later output into this command's message
             stdout = io.StringIO()
+            # keep only text, so the exception and its frames are freed after the except
+            exc_fmt = None
+            exc_summary = None
 
             try:
                 with redirect_stdout(stdout):
@@ -122,48 +129,37 @@ class ReplExtension(Extension):
                         )
 
             except Exception as e:
-                value = stdout.getvalue()
-                val_fmt = f"`stdout`:\n```py\n{value}\n```" if value else None
+                exc_summary = f"{e.__class__.__name__}: {e}"
                 exc_fmt = f"Traceback:\n```py\n{traceback.format_exc()}\n```"
 
-                if val_fmt is not None:
-                    for before, after in self.blacklist.items():
-                        # .replace doesn't seem to work?
-                        temp = val_fmt.split(before)
-                        val_fmt = after.join(temp)
+            # read and format the output once, whichever way the code finished
+            value = stdout.getvalue()
+            outputs = []
 
-                    if len(val_fmt) > 2000:
-                        await send("Content is too big to be sent")
-                    else:
-                        await send(val_fmt)
-
-                for before, after in self.blacklist.items():
-                    # .replace doesn't seem to work?
-                    temp = exc_fmt.split(before)
-                    exc_fmt = after.join(temp)
+            if value:
+                val_fmt = apply_replacements(
+                    f"`stdout`:\n```py\n{value}\n```", self.blacklist
+                )
+                if len(val_fmt) > 2000:
+                    outputs.append("Content is too big to be sent")
+                else:
+                    outputs.append(val_fmt)
 
+            if exc_fmt is not None:
+                exc_fmt = apply_replacements(exc_fmt, self.blacklist)
                 if len(exc_fmt) > 2000:
-                    await send(
-                        "Traceback is too big to be sent\n"
-                        f"{e.__class__.__name__}: {e.__str__()}"
-                    )
+                    outputs.append(f"Traceback is too big to be sent\n{exc_summary}")
                 else:
-                    await send(exc_fmt)
+                    outputs.append(exc_fmt)
 
+            # send stdout and the traceback together when they fit in one message
+            combined = "\n".join(outputs)
+            if len(combined) <= 2000:
+                if combined:
+                    await send(combined)
             else:
-                value = stdout.getvalue()
-                val_fmt = f"`stdout`:\n```py\n{value}\n```" if value else None
-
-                if val_fmt is not None:
-                    for before, after in self.blacklist.items():
-                        # .replace doesn't seem to work?
-                        temp = val_fmt.split(before)
-                        val_fmt = after.join(temp)
-
-                    if len(val_fmt) > 2000:
-                        await send("Content is too big to be sent")
-                    else:
-                        await send(val_fmt)
+                for output in outputs:
+                    await send(output)
 
 
 def setup(client, blacklist: Dict[str, str] = None):